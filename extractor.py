@@ -8,76 +8,131 @@ Version: 2.0
 """
 
 import sys
+import os
 import subprocess
 
 def check_and_install_dependencies():
     """
     Check for required dependencies and install if missing
+    
+    Silent when everything is already installed
     """
     required_packages = {
         'requests': 'requests',
         'pytz': 'pytz',
-        'flask': 'flask'
+        'flask': 'flask',
+        'lxml': 'lxml',
+        'orjson': 'orjson'
     }
     
     missing_packages = []
     
-    print("\n" + "="*60)
-    print("🔍 Checking for required dependencies...")
-    print("="*60)
-    
     for package_import, package_install in required_packages.items():
         try:
             __import__(package_import)
-            print(f"  ✓ {package_install} is installed")
         except ImportError:
             missing_packages.append(package_install)
-            print(f"  ✗ {package_install} is NOT installed")
     
-    if missing_packages:
-        print(f"\n📦 Installing {len(missing_packages)} missing package(s)...")
-        try:
-            for package in missing_packages:
-                print(f"  📥 Installing {package}...")
-                subprocess.check_call(
-                    [sys.executable, '-m', 'pip', 'install', package],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            print("\n✅ All dependencies successfully installed!")
-        except Exception as e:
-            print(f"❌ Error installing dependencies: {e}")
-            sys.exit(1)
-    else:
-        print("\n✅ All dependencies are already installed!")
+    if not missing_packages:
+        return
+    
+    print("\n" + "="*60)
+    print("🔍 Checking for required dependencies...")
+    print("="*60)
+    
+    for package in missing_packages:
+        print(f"  ✗ {package} is NOT installed")
+    
+    print(f"\n📦 Installing {len(missing_packages)} missing package(s)...")
+    try:
+        for package in missing_packages:
+            print(f"  📥 Installing {package}...")
+            subprocess.check_call(
+                [sys.executable, '-m', 'pip', 'install', package],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        print("\n✅ All dependencies successfully installed!")
+    except Exception as e:
+        print(f"❌ Error installing dependencies: {e}")
+        sys.exit(1)
     
     print("="*60 + "\n")
 
-# Run dependency check
-check_and_install_dependencies()
+# Run dependency check only when launched as a script, so importing the
+# module (workers, WSGI servers, tests) never spawns pip.
+# Set REALESTATE_SKIP_DEPENDENCY_CHECK=1 to skip it entirely.
+if __name__ == '__main__' and not os.environ.get('REALESTATE_SKIP_DEPENDENCY_CHECK'):
+    check_and_install_dependencies()
 
 # Import required modules
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import gzip
-import xml.etree.ElementTree as ET
-import csv
-import json
+from lxml import etree
+import orjson
 import re
 import platform
 import argparse
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from io import BytesIO
-from urllib.parse import urlparse
-import os
+from io import BufferedReader
 import time
 import pytz
 import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
-from flask import Flask, render_template_string, request, jsonify, send_from_directory
+import sqlite3
+import importlib.util
+from flask import Flask, Response, render_template_string, request, jsonify, send_from_directory
+
+# Optional: python-isal's SIMD-accelerated inflate decompresses sitemaps
+# several times faster than the stdlib; falls back to gzip when absent
+try:
+    from isal.igzip import IGzipFile as GzipFile
+except ImportError:
+    from gzip import GzipFile
+
+
+# XML namespace used by sitemap <urlset> and <sitemapindex> documents
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+# On-disk cache of parent sitemap -> child sitemap URLs, revalidated with conditional GETs
+SITEMAP_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'zillow_extractor', 'sitemap_index.sqlite'
+)
+
+# In-memory cache of recently resolved parent sitemaps:
+# parent URL -> (expiry on the time.monotonic() clock, child URLs)
+CHILDREN_CACHE_TTL = 3600
+CHILDREN_CACHE_SIZE = 32
+children_cache = {}
+children_cache_lock = threading.Lock()
+
+# Leading bytes of a gzip stream
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Sitemap lastmod format: UTC hour, minutes, seconds
+LASTMOD_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}):([0-5]\d):([0-5]\d)Z?\Z')
 
+# Output columns, in file order
+LISTING_FIELDS = (
+    'property_id',
+    'listing_url',
+    'address',
+    'city',
+    'state',
+    'zipcode',
+    'last_modified',
+    'last_modified_est'
+)
+
+# Number of recent log entries kept for the web UI
+LOG_HISTORY_SIZE = 500
 
 # Global extraction status dictionary
 extraction_status = {
@@ -87,16 +142,229 @@ extraction_status = {
     'total_categories': 0,
     'processed_categories': 0,
     'total_properties': 0,
-    'logs': [],
+    'logs': deque(maxlen=LOG_HISTORY_SIZE),
+    'log_seq': 0,
     'files': [],
+    'file_seq': 0,
     'start_time': None,
     'end_time': None,
+    'start_ts_ms': None,
+    'end_ts_ms': None,
     'output_dir': None,
     'error': None
 }
 
-# Global pause flag
-extraction_paused = False
+# Cleared by /pause and set by /resume; workers block on it between
+# sitemaps instead of polling a flag
+resume_event = threading.Event()
+resume_event.set()
+
+# Set by /stop; workers check it between sitemaps and while reading
+stop_event = threading.Event()
+
+# Signalled on every extraction_status change so /events streams can
+# push updates as they happen instead of the browser polling /status
+status_changed = threading.Condition()
+status_version = 0
+
+# Minimum seconds between two /events messages; bursts of log lines
+# within this window are coalesced into a single update
+STATUS_EVENT_INTERVAL = 0.25
+
+# Seconds of silence after which /events sends a keep-alive comment
+STATUS_KEEPALIVE = 15
+
+
+def notify_status_change():
+    """
+    Wake /events streams after extraction_status has been modified
+    """
+    global status_version
+    with status_changed:
+        status_version += 1
+        status_changed.notify_all()
+
+
+def append_log(entry):
+    """
+    Append a web UI log entry and notify /events streams
+    
+    log_seq counts every entry ever appended, so clients can ask for
+    only the entries after the last sequence number they have seen
+    
+    Args:
+        entry: Formatted log line
+    """
+    with status_changed:
+        # Bounded deque drops the oldest entry once LOG_HISTORY_SIZE is reached
+        extraction_status['logs'].append(entry)
+        extraction_status['log_seq'] += 1
+        notify_status_change()
+
+
+def add_output_file(filename):
+    """
+    Record a saved output file and notify /events streams
+    
+    file_seq counts every file ever recorded, so clients can ask for
+    only the files saved after the last sequence number they have seen
+    
+    Args:
+        filename: Name of the file inside the output directory
+    """
+    with status_changed:
+        extraction_status['files'].append(filename)
+        extraction_status['file_seq'] += 1
+        notify_status_change()
+
+
+def update_status(**changes):
+    """
+    Update extraction_status fields and notify /events streams
+    
+    Args:
+        **changes: Status keys and their new values
+    """
+    extraction_status.update(changes)
+    notify_status_change()
+
+
+def entries_since(entries, seq, since):
+    """
+    Select the entries appended after a sequence cursor
+    
+    Args:
+        entries: Retained entries, oldest first
+        seq: Sequence number of the newest entry
+        since: Cursor previously returned to the client (or None for all)
+        
+    Returns:
+        List of entries newer than the cursor
+    """
+    entries = list(entries)
+    if since is None:
+        return entries
+    
+    new_entries = seq - since
+    return entries[-new_entries:] if new_entries > 0 else []
+
+
+def status_snapshot(since=None, files_since=None):
+    """
+    Copy extraction_status into a JSON-serializable dict
+    
+    Args:
+        since: Optional log_seq cursor; only log entries appended after
+            it are included
+        files_since: Optional file_seq cursor; only files saved after it
+            are included
+        
+    Returns:
+        Dictionary of the current status with logs/files as lists
+    """
+    with status_changed:
+        return dict(
+            extraction_status,
+            logs=entries_since(extraction_status['logs'], extraction_status['log_seq'], since),
+            files=entries_since(extraction_status['files'], extraction_status['file_seq'], files_since)
+        )
+
+
+# Upper bound on concurrent extraction workers; matches the connection
+# pool size so every worker can hold its own keep-alive connection
+MAX_WORKERS = 64
+
+# Shared HTTP session: /get-children lookups and all extraction workers
+# reuse its keep-alive connections instead of opening a new TCP+TLS
+# connection per request; transient 429/5xx responses are retried
+http_session = requests.Session()
+http_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=MAX_WORKERS,
+    pool_block=False,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+http_session.mount('https://', http_adapter)
+http_session.mount('http://', http_adapter)
+http_session.headers['Accept-Encoding'] = 'gzip'
+
+
+def release_element(elem):
+    """
+    Free a fully processed element during iterparse
+    
+    Clears the element and drops already-processed siblings so the
+    partially built tree stays bounded regardless of sitemap size
+    """
+    elem.clear(keep_tail=True)
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def open_sitemap_stream(response):
+    """
+    Wrap a streaming sitemap response in a readable file object
+    
+    Gzipped payloads are detected by their magic bytes and decompressed
+    on the fly as the parser reads, so the body is never buffered whole
+    
+    Args:
+        response: requests response opened with stream=True
+        
+    Returns:
+        File-like object yielding the sitemap XML
+    """
+    # Keep the raw stream open at EOF; the caller closes the response
+    response.raw.decode_content = True
+    response.raw.auto_close = False
+    stream = BufferedReader(response.raw, buffer_size=1 << 16)
+    
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        return GzipFile(fileobj=stream)
+    return stream
+
+
+def sitemap_accept_encoding(url):
+    """
+    Choose the Accept-Encoding to request for a sitemap URL
+    
+    .gz sitemaps are already compressed; asking for gzip would only let
+    the server compress them a second time, costing an extra inflate
+    pass on our side
+    
+    Args:
+        url: Sitemap URL
+        
+    Returns:
+        Accept-Encoding header value
+    """
+    if url.split('?', 1)[0].endswith('.gz'):
+        return 'identity'
+    return 'gzip'
+
+
+def csv_escape(value):
+    """
+    Format a value as a CSV field, quoting only when required
+    
+    Matches csv.QUOTE_MINIMAL output for the string/None values
+    produced by the extractor
+    
+    Args:
+        value: Field value (string or None)
+        
+    Returns:
+        CSV-safe field string
+    """
+    if value is None:
+        return ''
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
 
 class WebUILogger(logging.Handler):
@@ -104,15 +372,26 @@ class WebUILogger(logging.Handler):
     Custom logging handler for Web UI
     Captures log messages and stores them for display in the web interface
     """
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        
+        # Formatted timestamp cached for the current second
+        self.last_second = None
+        self.last_timestamp = ''
+    
     def emit(self, record):
         log_entry = self.format(record)
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        formatted_log = f"[{timestamp}] {log_entry}"
-        extraction_status['logs'].append(formatted_log)
         
-        # Keep only the last 200 log entries to prevent memory issues
-        if len(extraction_status['logs']) > 200:
-            extraction_status['logs'] = extraction_status['logs'][-200:]
+        # Reformat the timestamp only when the second changes; uses the
+        # record's creation time rather than when the listener emits it
+        second = int(record.created)
+        if second != self.last_second:
+            self.last_timestamp = time.strftime('%H:%M:%S', time.localtime(second))
+            self.last_second = second
+        
+        formatted_log = f"[{self.last_timestamp}] {log_entry}"
+        
+        append_log(formatted_log)
 
 
 class RealEstateExtractor:
@@ -132,9 +411,6 @@ class RealEstateExtractor:
             output_format: Output format (csv or json)
             webui_mode: Whether running in web UI mode
         """
-        # Initialize HTTP session
-        self.session = requests.Session()
-        
         # User agents to rotate for better success rate
         self.bot_agents = [
             'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
@@ -150,6 +426,9 @@ class RealEstateExtractor:
         self.output_format = output_format
         self.webui_mode = webui_mode
         
+        # Shared pooled HTTP session (keep-alive connections, retries)
+        self.session = http_session
+        
         # Tracking variables
         self.saved_files = []
         self.total_properties = 0
@@ -163,19 +442,25 @@ class RealEstateExtractor:
         
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Track seen property IDs to avoid duplicates
+        # Track seen property IDs to avoid duplicates (ints for numeric zpids)
         self.seen_ids = set()
         
+        # Interning table for zipcode strings
+        self.zipcode_pool = {}
+        
         # Setup logging
         self.setup_logging()
         
         # Update web UI status
         if webui_mode:
-            extraction_status['output_dir'] = self.output_dir
+            update_status(output_dir=self.output_dir)
     
     def setup_logging(self):
         """
         Setup logging system with file and console handlers
+        
+        Handlers run on a single QueueListener thread; worker threads only
+        enqueue records, so they never contend on the handler locks
         """
         log_filename = os.path.join(
             self.output_dir, 
@@ -199,17 +484,41 @@ class RealEstateExtractor:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self.log_handlers = [file_handler, console_handler]
         
         # Web UI handler if in web mode
         if self.webui_mode:
             web_handler = WebUILogger()
             web_handler.setFormatter(formatter)
-            self.logger.addHandler(web_handler)
+            self.log_handlers.append(web_handler)
+        
+        # Route records through a queue to the listener thread; SimpleQueue
+        # puts are lock-free C calls, so logging never blocks a worker
+        self.log_queue = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(self.log_queue)
+        self.logger.addHandler(self.queue_handler)
+        
+        self.log_listener = QueueListener(
+            self.log_queue, *self.log_handlers, respect_handler_level=True
+        )
+        self.log_listener.start()
         
         self.logger.info(f"Log file created: {log_filename}")
     
+    def close(self):
+        """
+        Flush queued log records and release the log file
+        """
+        if self.log_listener is None:
+            return
+        
+        self.logger.removeHandler(self.queue_handler)
+        self.log_listener.stop()
+        self.log_listener = None
+        
+        for handler in self.log_handlers:
+            handler.close()
+    
     def convert_utc_to_est(self, utc_datetime_str):
         """
         Convert UTC datetime string to EST timezone
@@ -239,33 +548,66 @@ class RealEstateExtractor:
             self.logger.debug(f"Failed to convert datetime: {e}")
             return None
     
+    def convert_lastmods_to_est(self, lastmods):
+        """
+        Convert a batch of UTC datetime strings to formatted EST strings
+        
+        US/Eastern offsets only change on whole UTC hours, so timezone
+        conversion runs once per distinct hour and each timestamp's minutes
+        and seconds are spliced into the precomputed EST prefix
+        
+        Args:
+            lastmods: List of UTC datetime strings in ISO format
+            
+        Returns:
+            List of formatted EST strings (None where conversion failed)
+        """
+        hours = {}
+        formatted = {}
+        for value in set(lastmods):
+            match = LASTMOD_PATTERN.match(value) if value else None
+            
+            # Unusual format: fall back to a full conversion
+            if match is None:
+                est_dt = self.convert_utc_to_est(value)
+                formatted[value] = est_dt.strftime('%Y-%m-%d %H:%M:%S %Z') if est_dt else None
+                continue
+            
+            utc_hour, minutes, seconds = match.groups()
+            if utc_hour not in hours:
+                est_dt = self.convert_utc_to_est(f'{utc_hour}:00:00')
+                hours[utc_hour] = (
+                    (est_dt.strftime('%Y-%m-%d %H'), est_dt.strftime('%Z')) if est_dt else None
+                )
+            
+            hour = hours[utc_hour]
+            formatted[value] = f'{hour[0]}:{minutes}:{seconds} {hour[1]}' if hour else None
+        
+        return [formatted[value] for value in lastmods]
+    
     def download_sitemap(self, url):
         """
-        Download and decompress sitemap from URL
+        Open a streaming download of a sitemap
         
         Args:
             url: Sitemap URL to download
             
         Returns:
-            Decompressed sitemap content as string or None if failed
+            Streaming response (read via open_sitemap_stream) or None if failed
         """
         try:
-            # Set random user agent
-            self.session.headers['User-Agent'] = random.choice(self.bot_agents)
+            # Pick a random user agent per request rather than mutating the
+            # session headers shared by all workers
+            headers = {
+                'User-Agent': random.choice(self.bot_agents),
+                'Accept-Encoding': sitemap_accept_encoding(url)
+            }
             
-            # Download sitemap
-            response = self.session.get(url, timeout=30)
+            # Start download; the body is read lazily while parsing
+            response = self.session.get(url, headers=headers, timeout=30, stream=True)
             response.raise_for_status()
             
-            # Try to decompress if gzipped
-            try:
-                with gzip.GzipFile(fileobj=BytesIO(response.content)) as gz:
-                    content = gz.read().decode('utf-8')
-            except (OSError, gzip.BadGzipFile):
-                # Not gzipped, use as-is
-                content = response.text
-            
-            return content
+            return response
         except Exception as e:
             self.logger.error(f"Failed to download sitemap {url}: {e}")
             return None
@@ -274,53 +616,127 @@ class RealEstateExtractor:
         """
         Parse listing URL to extract property details
         
+        Specialised for the fixed listing URL shape
+        https://<host>/<type>/<street-city-STATE-ZIPCODE>/<id>_zpid/:
+        the address slug is validated by scanning back for its last two
+        dashes instead of running a regex
+        
         Args:
             url: Full listing URL
             
         Returns:
             Dictionary with property details or None if parsing failed
         """
-        try:
-            # Parse URL path
-            path = urlparse(url).path
-            parts = path.strip('/').split('/')
+        if not url:
+            return None
+        
+        # Ignore any query string or fragment, as urlparse().path would
+        if '?' in url or '#' in url:
+            url = url.split('#', 1)[0].split('?', 1)[0]
+        
+        # Split URL: scheme, '', host, type, address, id
+        parts = url.split('/', 6)
+        if len(parts) < 6 or not parts[5]:
+            return None
+        
+        slug = parts[4]
+        
+        # Extract property ID
+        property_id = parts[5].replace('_zpid', '')
+        
+        # Parse address format: street-city-STATE-ZIPCODE
+        dash_zip = slug.rfind('-')
+        dash_state = slug.rfind('-', 0, dash_zip) if dash_zip > 0 else -1
+        if dash_state <= 0:
+            return None
+        
+        zipcode = slug[dash_zip + 1:]
+        state = slug[dash_state + 1:dash_zip]
+        if not (len(zipcode) == 5 and zipcode.isdecimal()
+                and len(state) == 2 and state.isascii() and state.isalpha() and state.isupper()):
+            return None
+        
+        # Share one string object per distinct state/zipcode
+        # across the millions of rows held in the columns
+        state = sys.intern(state)
+        zipcode = self.zipcode_pool.setdefault(zipcode, zipcode)
+        
+        # Split address and city: the last two words are the city
+        dash_city = slug.rfind('-', 0, dash_state)
+        if dash_city >= 0:
+            dash_city = slug.rfind('-', 0, dash_city)
+            city = slug[dash_city + 1:dash_state].replace('-', ' ')
+            address = slug[:max(dash_city, 0)].replace('-', ' ')
+        else:
+            address = slug[:dash_state]
+            city = ''
+        
+        return {
+            'property_id': property_id,
+            'address': address,
+            'city': city,
+            'state': state,
+            'zipcode': zipcode
+        }
+    
+    def parse_listing_batch(self, listing_urls, lastmods):
+        """
+        Parse a batch of listing URLs into listing records
+        
+        Args:
+            listing_urls: List of listing URLs
+            lastmods: List of UTC last modified strings, parallel to listing_urls
             
-            if len(parts) >= 3:
-                address_part = parts[1]
-                id_part = parts[2]
-                
-                # Extract property ID
-                property_id = id_part.replace('_zpid', '')
-                
-                # Parse address format: street-city-STATE-ZIPCODE
-                pattern = r'^(.+?)-([A-Z]{2})-(\d{5})$'
-                match = re.search(pattern, address_part)
-                
-                if match:
-                    address_city = match.group(1)
-                    state = match.group(2)
-                    zipcode = match.group(3)
-                    
-                    # Split address and city
-                    parts_list = address_city.split('-')
-                    if len(parts_list) >= 2:
-                        city = ' '.join(parts_list[-2:])
-                        address = ' '.join(parts_list[:-2])
-                    else:
-                        address = address_city.replace('-', ' ')
-                        city = ''
-                    
-                    return {
-                        'property_id': property_id,
-                        'address': address,
-                        'city': city,
-                        'state': state,
-                        'zipcode': zipcode
-                    }
-        except Exception as e:
-            self.logger.debug(f"Failed to parse URL {url}: {e}")
+        Returns:
+            Dictionary of column lists keyed by field name (see LISTING_FIELDS),
+            skipping unparseable and duplicate URLs. last_modified_est holds
+            preformatted strings
+        """
+        # Bind hot lookups to locals for the per-URL loop
+        parse_listing_url = self.parse_listing_url
+        seen_ids = self.seen_ids
         
-        return None
+        # One list per output column instead of one dict per listing
+        ids, urls, addresses, cities, states, zipcodes = [], [], [], [], [], []
+        kept_lastmods = []
+        
+        for listing_url, last_modified_utc in zip(listing_urls, lastmods):
+            # Parse listing details from URL
+            parsed = parse_listing_url(listing_url)
+            
+            # Skip unparseable URLs
+            if not parsed:
+                continue
+            
+            # Skip duplicates; numeric zpids are tracked as ints, which are
+            # smaller and faster to hash than the equivalent strings. IDs with
+            # leading zeros stay strings so '0123' and '123' remain distinct
+            property_id = parsed['property_id']
+            if (property_id.isascii() and property_id.isdigit()
+                    and (property_id[0] != '0' or len(property_id) == 1)):
+                seen_key = int(property_id)
+            else:
+                seen_key = property_id
+            if seen_key in seen_ids:
+                continue
+            
+            ids.append(property_id)
+            urls.append(listing_url)
+            addresses.append(parsed['address'])
+            cities.append(parsed['city'])
+            states.append(parsed['state'])
+            zipcodes.append(parsed['zipcode'])
+            kept_lastmods.append(last_modified_utc)
+            
+            # Add to seen IDs
+            seen_ids.add(seen_key)
+        
+        # Convert timestamps for the whole batch at once
+        lastmods_est = self.convert_lastmods_to_est(kept_lastmods)
+        
+        return dict(zip(LISTING_FIELDS, (
+            ids, urls, addresses, cities, states, zipcodes, kept_lastmods, lastmods_est
+        )))
     
     def extract_listings_from_sitemap(self, sitemap_url):
         """
@@ -330,63 +746,52 @@ class RealEstateExtractor:
             sitemap_url: URL of the sitemap to process
             
         Returns:
-            List of listing dictionaries
+            Dictionary of column lists keyed by field name (see LISTING_FIELDS),
+            or None if extraction was stopped before the sitemap was fully read
         """
-        # Download sitemap content
-        content = self.download_sitemap(sitemap_url)
-        if not content:
-            return []
-        
-        # Parse XML
-        root = ET.fromstring(content)
-        namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-        
-        listings = []
-        urls = root.findall('ns:url', namespace)
-        total_urls = len(urls)
-        
-        self.logger.info(f"Processing {total_urls} URLs from sitemap...")
-        
-        # Process each URL in sitemap
-        for idx, url_elem in enumerate(urls, 1):
-            # Log progress every 10,000 URLs
-            if idx % 10000 == 0:
-                self.logger.info(f"Processed {idx}/{total_urls} URLs...")
-            
-            # Extract URL and last modified date
-            loc = url_elem.find('ns:loc', namespace)
-            lastmod = url_elem.find('ns:lastmod', namespace)
-            
-            if loc is not None:
-                listing_url = loc.text
-                last_modified_utc = lastmod.text if lastmod is not None else ''
-                last_modified_est = self.convert_utc_to_est(last_modified_utc)
-                
-                # Parse listing details from URL
-                parsed = self.parse_listing_url(listing_url)
-                
-                if parsed:
-                    # Check for duplicates
-                    if parsed['property_id'] in self.seen_ids:
-                        continue
+        # Open sitemap download
+        response = self.download_sitemap(sitemap_url)
+        if response is None:
+            return {field: [] for field in LISTING_FIELDS}
+        
+        self.logger.info("Reading URLs from sitemap...")
+        
+        # Collect raw <loc>/<lastmod> values in a single streaming pass;
+        # decompression and parsing overlap with the network read and only
+        # one <url> element is held in memory at a time
+        listing_urls = []
+        lastmods = []
+        try:
+            with response, open_sitemap_stream(response) as source:
+                url_elements = etree.iterparse(source, tag=f'{SITEMAP_NS}url')
+                for idx, (_, url_elem) in enumerate(url_elements, 1):
+                    # Log progress every 10,000 URLs
+                    if idx % 10000 == 0:
+                        self.logger.info(f"Read {idx} URLs...")
+                        
+                        # Abandon the download when extraction is stopped
+                        if stop_event.is_set():
+                            self.logger.info(f"Stopped while reading {sitemap_url}")
+                            return None
                     
-                    # Create listing record
-                    listing = {
-                        'property_id': parsed['property_id'],
-                        'listing_url': listing_url,
-                        'address': parsed['address'],
-                        'city': parsed['city'],
-                        'state': parsed['state'],
-                        'zipcode': parsed['zipcode'],
-                        'last_modified': last_modified_utc,
-                        'last_modified_est': last_modified_est
-                    }
+                    loc = url_elem.find(f'{SITEMAP_NS}loc')
+                    lastmod = url_elem.find(f'{SITEMAP_NS}lastmod')
                     
-                    # Add to seen IDs
-                    self.seen_ids.add(parsed['property_id'])
-                    listings.append(listing)
+                    if loc is not None and loc.text:
+                        listing_urls.append(loc.text)
+                        lastmods.append(lastmod.text if lastmod is not None else '')
+                    
+                    release_element(url_elem)
+        except Exception as e:
+            self.logger.error(f"Failed to read sitemap {sitemap_url}: {e}")
+            return {field: [] for field in LISTING_FIELDS}
+        
+        self.logger.info(f"Processing {len(listing_urls)} URLs from sitemap...")
+        
+        # Parse the whole batch in one tight loop
+        listings = self.parse_listing_batch(listing_urls, lastmods)
         
-        self.logger.info(f"✓ Extracted {len(listings)} unique listings")
+        self.logger.info(f"✓ Extracted {len(listings['property_id'])} unique listings")
         return listings
     
     def save_to_csv(self, listings, category):
@@ -394,13 +799,14 @@ class RealEstateExtractor:
         Save listings to CSV file
         
         Args:
-            listings: List of listing dictionaries
+            listings: Dictionary of column lists keyed by field name
             category: Category name for filename
             
         Returns:
             Path to saved file or None if failed
         """
-        if not listings:
+        count = len(listings['property_id'])
+        if not count:
             return None
         
         # Generate filename with timestamp
@@ -408,43 +814,29 @@ class RealEstateExtractor:
         filename = f"listings_{category}_{timestamp}.csv"
         filepath = os.path.join(self.output_dir, filename)
         
-        # CSV field names
-        fields = [
-            'property_id', 
-            'listing_url', 
-            'address', 
-            'city', 
-            'state', 
-            'zipcode', 
-            'last_modified', 
-            'last_modified_est'
-        ]
+        columns = [listings[field] for field in LISTING_FIELDS]
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fields)
-                writer.writeheader()
+            # Rows are formatted directly with a large write buffer; state,
+            # zipcode and the EST timestamp never need quoting, so only the
+            # free-form columns go through csv_escape
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(','.join(LISTING_FIELDS) + '\r\n')
                 
-                for listing in listings:
-                    row = {}
-                    for field in fields:
-                        value = listing.get(field, '')
-                        
-                        # Format EST datetime if present
-                        if field == 'last_modified_est' and value:
-                            value = value.strftime('%Y-%m-%d %H:%M:%S %Z')
-                        
-                        row[field] = value
-                    
-                    writer.writerow(row)
+                for property_id, url, address, city, state, zipcode, lastmod, lastmod_est in zip(*columns):
+                    f.write(
+                        f"{csv_escape(property_id)},{csv_escape(url)},{csv_escape(address)},"
+                        f"{csv_escape(city)},{state},{zipcode},{csv_escape(lastmod)},"
+                        f"{lastmod_est or ''}\r\n"
+                    )
             
             # Track saved file
             self.saved_files.append(filename)
             
             if self.webui_mode:
-                extraction_status['files'].append(filename)
+                add_output_file(filename)
             
-            self.logger.info(f"✓ Saved {len(listings)} records to CSV: {filename}")
+            self.logger.info(f"✓ Saved {count} records to CSV: {filename}")
             return filepath
             
         except Exception as e:
@@ -456,13 +848,14 @@ class RealEstateExtractor:
         Save listings to JSON file
         
         Args:
-            listings: List of listing dictionaries
+            listings: Dictionary of column lists keyed by field name
             category: Category name for filename
             
         Returns:
             Path to saved file or None if failed
         """
-        if not listings:
+        count = len(listings['property_id'])
+        if not count:
             return None
         
         # Generate filename with timestamp
@@ -471,28 +864,29 @@ class RealEstateExtractor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            # Prepare data for JSON export
-            data = []
-            for listing in listings:
-                item = dict(listing)
+            columns = [listings[field] for field in LISTING_FIELDS]
+            
+            # Stream one record at a time instead of building the whole list;
+            # records are re-indented to nest inside the top-level array
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                f.write(b'[')
+                separator = b'\n  '
                 
-                # Convert datetime to string for JSON serialization
-                if item.get('last_modified_est'):
-                    item['last_modified_est'] = item['last_modified_est'].strftime('%Y-%m-%d %H:%M:%S %Z')
+                for row in zip(*columns):
+                    record = orjson.dumps(dict(zip(LISTING_FIELDS, row)), option=orjson.OPT_INDENT_2)
+                    f.write(separator)
+                    f.write(record.replace(b'\n', b'\n  '))
+                    separator = b',\n  '
                 
-                data.append(item)
-            
-            # Write JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(b'\n]')
             
             # Track saved file
             self.saved_files.append(filename)
             
             if self.webui_mode:
-                extraction_status['files'].append(filename)
+                add_output_file(filename)
             
-            self.logger.info(f"✓ Saved {len(listings)} records to JSON: {filename}")
+            self.logger.info(f"✓ Saved {count} records to JSON: {filename}")
             return filepath
             
         except Exception as e:
@@ -508,16 +902,11 @@ class RealEstateExtractor:
             current: Current sitemap number
             total: Total number of sitemaps
         """
-        global extraction_paused
-        
-        # Handle pause state
-        while extraction_paused:
-            time.sleep(1)
-            if not extraction_status['running']:
-                return
+        # Block while paused; /stop also releases paused workers
+        resume_event.wait()
         
         # Handle stop state
-        if not extraction_status['running']:
+        if stop_event.is_set():
             return
         
         # Extract category name from URL
@@ -529,13 +918,19 @@ class RealEstateExtractor:
         
         # Update web UI status
         if self.webui_mode:
-            extraction_status['current_category'] = category
-            extraction_status['processed_categories'] = current
-            extraction_status['progress'] = int((current / total) * 100)
+            update_status(
+                current_category=category,
+                processed_categories=current,
+                progress=int((current / total) * 100)
+            )
         
         # Extract listings
         listings = self.extract_listings_from_sitemap(sitemap_url)
         
+        # Don't save a partially read sitemap
+        if listings is None:
+            return
+        
         # Save listings
         if self.output_format == 'csv':
             self.save_to_csv(listings, category)
@@ -543,10 +938,10 @@ class RealEstateExtractor:
             self.save_to_json(listings, category)
         
         # Update totals
-        self.total_properties += len(listings)
+        self.total_properties += len(listings['property_id'])
         
         if self.webui_mode:
-            extraction_status['total_properties'] = self.total_properties
+            update_status(total_properties=self.total_properties)
     
     def run(self):
         """
@@ -555,54 +950,61 @@ class RealEstateExtractor:
         start_time = time.time()
         
         if self.webui_mode:
-            extraction_status['start_time'] = datetime.now().isoformat()
+            update_status(start_time=datetime.now().isoformat(), start_ts_ms=int(time.time() * 1000))
         
-        self.logger.info("="*60)
-        self.logger.info("Real Estate Listing Metadata Extraction")
-        self.logger.info("="*60)
-        self.logger.info(f"Output format: {self.output_format.upper()}")
-        self.logger.info(f"Output directory: {self.output_dir}")
-        self.logger.info(f"Concurrent workers: {self.max_workers}")
-        
-        if not self.sitemap_urls:
-            self.logger.error("No sitemaps provided for extraction!")
-            return
-        
-        total_sitemaps = len(self.sitemap_urls)
-        
-        if self.webui_mode:
-            extraction_status['total_categories'] = total_sitemaps
-        
-        self.logger.info(f"Processing {total_sitemaps} sitemaps...\n")
-        
-        # Process sitemaps concurrently
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.process_sitemap, url, i+1, total_sitemaps): url 
-                for i, url in enumerate(self.sitemap_urls)
-            }
+        try:
+            self.logger.info("="*60)
+            self.logger.info("Real Estate Listing Metadata Extraction")
+            self.logger.info("="*60)
+            self.logger.info(f"Output format: {self.output_format.upper()}")
+            self.logger.info(f"Output directory: {self.output_dir}")
+            self.logger.info(f"Concurrent workers: {self.max_workers}")
             
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    self.logger.error(f"Error processing sitemap: {e}")
-        
-        # Calculate execution time
-        execution_time = time.time() - start_time
-        minutes = int(execution_time // 60)
-        seconds = int(execution_time % 60)
-        
-        self.logger.info("\n" + "="*60)
-        self.logger.info("EXTRACTION COMPLETE!")
-        self.logger.info(f"Execution time: {minutes}m {seconds}s")
-        self.logger.info(f"Total listings extracted: {self.total_properties:,}")
-        self.logger.info(f"Total files created: {len(self.saved_files)}")
-        self.logger.info("="*60)
-        
-        if self.webui_mode:
-            extraction_status['end_time'] = datetime.now().isoformat()
-            extraction_status['running'] = False
+            if not self.sitemap_urls:
+                self.logger.error("No sitemaps provided for extraction!")
+                return
+            
+            total_sitemaps = len(self.sitemap_urls)
+            
+            if self.webui_mode:
+                update_status(total_categories=total_sitemaps)
+            
+            self.logger.info(f"Processing {total_sitemaps} sitemaps...\n")
+            
+            # Process sitemaps concurrently
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self.process_sitemap, url, i+1, total_sitemaps): url 
+                    for i, url in enumerate(self.sitemap_urls)
+                }
+                
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error processing sitemap: {e}")
+            
+            # Calculate execution time
+            execution_time = time.time() - start_time
+            minutes = int(execution_time // 60)
+            seconds = int(execution_time % 60)
+            
+            self.logger.info("\n" + "="*60)
+            self.logger.info("EXTRACTION COMPLETE!")
+            self.logger.info(f"Execution time: {minutes}m {seconds}s")
+            self.logger.info(f"Total listings extracted: {self.total_properties:,}")
+            self.logger.info(f"Total files created: {len(self.saved_files)}")
+            self.logger.info("="*60)
+        finally:
+            # Flush pending log records before reporting completion
+            self.close()
+            
+            if self.webui_mode:
+                update_status(
+                    end_time=datetime.now().isoformat(),
+                    end_ts_ms=int(time.time() * 1000),
+                    running=False
+                )
         
         # Auto-open output folder on Windows
         if platform.system() == 'Windows' and self.saved_files:
@@ -612,44 +1014,216 @@ class RealEstateExtractor:
                 pass
 
 
-def get_sitemap_children(parent_url):
+def open_sitemap_cache():
     """
-    Fetch child sitemap URLs from parent sitemap
+    Open the sitemap index cache database, creating it if needed
+    
+    Returns:
+        sqlite3 connection
+    """
+    os.makedirs(os.path.dirname(SITEMAP_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(SITEMAP_CACHE_PATH, timeout=10)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS sitemap_index ('
+        'url TEXT PRIMARY KEY, etag TEXT, lastmod TEXT, '
+        'children_json TEXT, fetched_at TEXT)'
+    )
+    return conn
+
+
+def load_cached_children(parent_url):
+    """
+    Look up cached child sitemaps for a parent sitemap
     
     Args:
         parent_url: URL of parent sitemap
         
     Returns:
-        List of child sitemap URLs
+        Tuple of (etag, last_modified, children) or None if not cached
     """
     try:
-        response = requests.get(parent_url, timeout=30)
-        response.raise_for_status()
-        
-        # Try to decompress if gzipped
+        conn = open_sitemap_cache()
         try:
-            with gzip.GzipFile(fileobj=BytesIO(response.content)) as gz:
-                content = gz.read().decode('utf-8')
-        except:
-            content = response.text
-        
-        # Parse XML
-        root = ET.fromstring(content)
-        namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-        
-        children = []
-        for sitemap in root.findall('ns:sitemap', namespace):
-            loc = sitemap.find('ns:loc', namespace)
+            row = conn.execute(
+                'SELECT etag, lastmod, children_json FROM sitemap_index WHERE url = ?',
+                (parent_url,)
+            ).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Sitemap cache unavailable: {e}")
+        return None
+    
+    if row is None:
+        return None
+    
+    etag, last_modified, children_json = row
+    return etag, last_modified, orjson.loads(children_json)
+
+
+def save_cached_children(parent_url, etag, last_modified, children):
+    """
+    Store child sitemaps for a parent sitemap along with its validators
+    
+    Args:
+        parent_url: URL of parent sitemap
+        etag: ETag response header (or None)
+        last_modified: Last-Modified response header (or None)
+        children: List of child sitemap URLs
+    """
+    try:
+        conn = open_sitemap_cache()
+        try:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO sitemap_index '
+                    '(url, etag, lastmod, children_json, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                    (parent_url, etag, last_modified, orjson.dumps(children).decode('utf-8'),
+                     datetime.now().isoformat())
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Failed to update sitemap cache: {e}")
+
+
+def clear_cached_children():
+    """
+    Remove all entries from the sitemap index cache database
+    """
+    try:
+        conn = open_sitemap_cache()
+        try:
+            with conn:
+                conn.execute('DELETE FROM sitemap_index')
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Failed to clear sitemap cache: {e}")
+
+
+def iter_child_sitemaps(response):
+    """
+    Stream child sitemap URLs out of a sitemap index response
+    
+    The body is decompressed and parsed as it downloads, and each
+    <sitemap> element is freed once read
+    
+    Args:
+        response: requests response opened with stream=True
+        
+    Yields:
+        Child sitemap URLs
+    """
+    with open_sitemap_stream(response) as source:
+        for _, sitemap in etree.iterparse(source, tag=f'{SITEMAP_NS}sitemap'):
+            loc = sitemap.find(f'{SITEMAP_NS}loc')
             if loc is not None:
-                children.append(loc.text)
+                yield loc.text
+            release_element(sitemap)
+
+
+def fetch_sitemap_children(parent_url):
+    """
+    Download a parent sitemap and extract its child sitemap URLs
+    
+    Previously fetched parents are revalidated with a conditional GET
+    and served from the on-disk cache when unchanged (HTTP 304)
+    
+    Args:
+        parent_url: URL of parent sitemap
         
-        return children
+    Returns:
+        List of child sitemap URLs
+    """
+    # Send cached validators so an unchanged index returns 304
+    cached = load_cached_children(parent_url)
+    headers = {'Accept-Encoding': sitemap_accept_encoding(parent_url)}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    response = http_session.get(parent_url, headers=headers, timeout=30, stream=True)
+    
+    with response:
+        if response.status_code == 304 and cached:
+            return cached[2]
+        
+        response.raise_for_status()
+        children = list(iter_child_sitemaps(response))
+    
+    # Cache only when the server gave us something to revalidate with
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if children and (etag or last_modified):
+        save_cached_children(parent_url, etag, last_modified, children)
+    
+    return children
+
+
+def get_sitemap_children(parent_url):
+    """
+    Fetch child sitemap URLs from parent sitemap
+    
+    Results are kept in memory for CHILDREN_CACHE_TTL seconds, so repeat
+    lookups within that window skip the network entirely
+    
+    Args:
+        parent_url: URL of parent sitemap
+        
+    Returns:
+        List of child sitemap URLs
+    """
+    with children_cache_lock:
+        entry = children_cache.get(parent_url)
+    if entry and entry[0] > time.monotonic():
+        return list(entry[1])
+    
+    try:
+        children = fetch_sitemap_children(parent_url)
     except Exception as e:
         print(f"Error fetching children from {parent_url}: {e}")
         return []
+    
+    if children:
+        with children_cache_lock:
+            # Re-insert at the end and evict the oldest entries when full
+            children_cache.pop(parent_url, None)
+            while len(children_cache) >= CHILDREN_CACHE_SIZE:
+                children_cache.pop(next(iter(children_cache)))
+            children_cache[parent_url] = (time.monotonic() + CHILDREN_CACHE_TTL, tuple(children))
+    
+    return children
+
+
 # Flask Web Application
 app = Flask(__name__)
 
+# Request threads when served by gunicorn; each open /events stream holds one
+WEB_SERVER_THREADS = 32
+
+# Parent sitemap indexes offered in the web UI: (group label, ((url, label), ...))
+SITEMAP_GROUPS = (
+    ('🏘️ Home Detail Pages (HDP)', (
+        ('https://www.zillow.com/xml/indexes/us/hdp/for-sale-by-agent.xml.gz', 'For Sale By Agent'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/for-sale-by-owner.xml.gz', 'For Sale By Owner'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/new-construction.xml.gz', 'New Construction'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/auction.xml.gz', 'Auction Properties'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/pending.xml.gz', 'Pending Sales'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/recently-sold.xml.gz', 'Recently Sold'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/for-rent.xml.gz', 'For Rent'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/off-market.xml.gz', 'Off Market'),
+        ('https://www.zillow.com/xml/indexes/us/hdp/other.xml.gz', 'Other Listings'),
+    )),
+    ('🏢 Building Detail Pages (BDP)', (
+        ('https://www.zillow.com/xml/indexes/us/bdp/buildings.xml.gz', 'Buildings'),
+        ('https://www.zillow.com/xml/indexes/us/bdp/apartments.xml.gz', 'Apartments'),
+    )),
+)
+
 # HTML Template for Web UI
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -947,21 +1521,13 @@ HTML_TEMPLATE = '''
                     <label>📂 Select Sitemaps (Hold CTRL/CMD to select multiple)</label>
                     <select name="sitemaps" id="sitemapSelect" multiple required>
                         <option value="ALL">✅ SELECT ALL SITEMAPS</option>
-                        <optgroup label="🏘️ Home Detail Pages (HDP)">
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/for-sale-by-agent.xml.gz">For Sale By Agent</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/for-sale-by-owner.xml.gz">For Sale By Owner</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/new-construction.xml.gz">New Construction</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/auction.xml.gz">Auction Properties</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/pending.xml.gz">Pending Sales</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/recently-sold.xml.gz">Recently Sold</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/for-rent.xml.gz">For Rent</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/off-market.xml.gz">Off Market</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/hdp/other.xml.gz">Other Listings</option>
-                        </optgroup>
-                        <optgroup label="🏢 Building Detail Pages (BDP)">
-                            <option value="https://www.zillow.com/xml/indexes/us/bdp/buildings.xml.gz">Buildings</option>
-                            <option value="https://www.zillow.com/xml/indexes/us/bdp/apartments.xml.gz">Apartments</option>
+                        {% for group_label, sitemaps in sitemap_groups %}
+                        <optgroup label="{{ group_label }}">
+                            {% for url, label in sitemaps %}
+                            <option value="{{ url }}">{{ label }}</option>
+                            {% endfor %}
                         </optgroup>
+                        {% endfor %}
                     </select>
                 </div>
                 
@@ -982,6 +1548,9 @@ HTML_TEMPLATE = '''
                             <option value="5" selected>5 Workers (Recommended)</option>
                             <option value="8">8 Workers (Fast)</option>
                             <option value="10">10 Workers (Very Fast)</option>
+                            <option value="16">16 Workers (Fast Network)</option>
+                            <option value="32">32 Workers (Fast Network)</option>
+                            <option value="64">64 Workers (Fast Network, Max)</option>
                         </select>
                     </div>
                 </div>
@@ -1050,22 +1619,20 @@ HTML_TEMPLATE = '''
     <!-- JavaScript -->
     <script>
         let statusInterval;
+        let statusEvents;
+        let clockInterval;
+        let status = {};
+        let logSeq = 0;
+        let fileSeq = 0;
+        let shownFiles = new Set();
+        let pendingLogs = [];
+        let pendingFiles = [];
+        let renderPending = false;
+        const MAX_LOG_ENTRIES = 50;
         let isPaused = false;
         
-        // All available sitemaps
-        const allSitemaps = [
-            'https://www.zillow.com/xml/indexes/us/hdp/for-sale-by-agent.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/for-sale-by-owner.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/new-construction.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/auction.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/pending.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/recently-sold.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/for-rent.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/off-market.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/hdp/other.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/bdp/buildings.xml.gz',
-            'https://www.zillow.com/xml/indexes/us/bdp/apartments.xml.gz',
-        ];
+        // All available sitemaps (rendered from SITEMAP_GROUPS)
+        const allSitemaps = {{ all_sitemaps | tojson }};
         
         // Form submission handler
         document.getElementById('extractForm').addEventListener('submit', async (e) => {
@@ -1088,15 +1655,15 @@ HTML_TEMPLATE = '''
             document.getElementById('startBtn').disabled = true;
             document.getElementById('startBtn').textContent = '⏳ Loading sitemaps...';
             
-            // Fetch child sitemaps from parent sitemaps
-            let children = [];
-            for (const parent of parents) {
-                const res = await fetch(`/get-children?url=${encodeURIComponent(parent)}`);
-                const data = await res.json();
-                if (data.children) {
-                    children = children.concat(data.children);
-                }
-            }
+            // Fetch child sitemaps for all parents in one request; the server
+            // resolves the parents concurrently
+            const childrenRes = await fetch('/get-children-bulk', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({parents: parents})
+            });
+            const childrenData = await childrenRes.json();
+            const children = childrenData.children || [];
             
             if (children.length === 0) {
                 alert('❌ No child sitemaps found!');
@@ -1129,8 +1696,7 @@ HTML_TEMPLATE = '''
                 document.getElementById('startBtn').disabled = false;
                 document.getElementById('startBtn').textContent = '🚀 Start Extraction';
             } else {
-                // Start status polling
-                statusInterval = setInterval(updateStatus, 500);
+                startStatusUpdates();
             }
         });
         
@@ -1157,45 +1723,153 @@ HTML_TEMPLATE = '''
             }
         });
         
-        // Update status from server
+        // Subscribe to server-pushed status updates; falls back to polling
+        // /status in browsers without EventSource
+        function startStatusUpdates() {
+            status = {};
+            pendingLogs = [];
+            pendingFiles = [];
+            document.getElementById('logs').replaceChildren();
+            document.getElementById('filesContainer').replaceChildren();
+            document.getElementById('filesList').style.display = 'none';
+            shownFiles = new Set();
+            isPaused = false;
+            if (window.EventSource) {
+                statusEvents = new EventSource('/events?since=' + logSeq);
+                statusEvents.onmessage = (e) => applyStatus(JSON.parse(e.data));
+            } else {
+                statusInterval = setInterval(updateStatus, 500);
+            }
+            // Keep the elapsed time ticking between status messages
+            clockInterval = setInterval(() => renderElapsed(status), 1000);
+        }
+        
+        function stopStatusUpdates() {
+            if (statusEvents) {
+                statusEvents.close();
+                statusEvents = null;
+            }
+            clearInterval(statusInterval);
+            clearInterval(clockInterval);
+        }
+        
+        // Poll status from server, asking only for unseen logs and files
         async function updateStatus() {
-            const res = await fetch('/status');
-            const s = await res.json();
+            const res = await fetch('/status?since=' + logSeq + '&files_since=' + fileSeq);
+            applyStatus(await res.json());
+        }
+        
+        // Merge a status update and schedule a render. SSE messages after
+        // the first carry only the changed keys; logs and files hold just
+        // the entries added since the previous update
+        function applyStatus(delta) {
+            if (delta.log_seq !== undefined) {
+                logSeq = delta.log_seq;
+            }
+            if (delta.file_seq !== undefined) {
+                fileSeq = delta.file_seq;
+            }
+            if (delta.logs) {
+                pendingLogs = pendingLogs.concat(delta.logs).slice(-MAX_LOG_ENTRIES);
+            }
+            if (delta.files) {
+                pendingFiles = pendingFiles.concat(delta.files);
+            }
+            delete delta.logs;
+            delete delta.files;
+            Object.assign(status, delta);
             
-            // Update progress bar
-            document.getElementById('progressBar').style.width = s.progress + '%';
-            document.getElementById('progressBar').textContent = s.progress + '%';
+            // Stop listening right away, even if the tab is hidden and the
+            // frame callback is deferred
+            if (!status.running) {
+                stopStatusUpdates();
+            }
             
-            // Update statistics
-            document.getElementById('statCategories').textContent = s.processed_categories + '/' + s.total_categories;
-            document.getElementById('statProperties').textContent = s.total_properties.toLocaleString();
-            document.getElementById('statCurrent').textContent = s.current_category || '-';
+            // Batch all DOM writes for this frame into one pass
+            if (!renderPending) {
+                renderPending = true;
+                requestAnimationFrame(() => {
+                    renderPending = false;
+                    appendLogs(pendingLogs);
+                    appendFiles(pendingFiles);
+                    pendingLogs = [];
+                    pendingFiles = [];
+                    renderStatus(status);
+                });
+            }
+        }
+        
+        // Add download links for newly saved files; names already shown
+        // (e.g. resent after an EventSource reconnect) are skipped
+        function appendFiles(files) {
+            if (files.length === 0) {
+                return;
+            }
             
-            // Update elapsed time
-            if (s.start_time) {
-                const elapsed = s.end_time 
-                    ? (new Date(s.end_time) - new Date(s.start_time)) / 1000 
-                    : (Date.now() - new Date(s.start_time)) / 1000;
+            const container = document.getElementById('filesContainer');
+            for (const f of files) {
+                if (shownFiles.has(f)) {
+                    continue;
+                }
+                shownFiles.add(f);
+                
+                const item = document.createElement('div');
+                item.className = 'file-item';
+                const name = document.createElement('span');
+                name.textContent = '📄 ' + f;
+                const link = document.createElement('a');
+                link.href = '/download?file=' + encodeURIComponent(f);
+                link.className = 'file-download';
+                link.textContent = '📥 Download';
+                item.append(name, link);
+                container.appendChild(item);
+            }
+            document.getElementById('filesList').style.display = 'block';
+        }
+        
+        // Append new log entries, keeping only the most recent ones in the
+        // page; entries are set as text so log content is never parsed as HTML
+        function appendLogs(lines) {
+            if (lines.length === 0) {
+                return;
+            }
+            
+            const logsDiv = document.getElementById('logs');
+            for (const line of lines) {
+                const entry = document.createElement('div');
+                entry.className = 'log-entry';
+                entry.textContent = line;
+                logsDiv.appendChild(entry);
+            }
+            while (logsDiv.childElementCount > MAX_LOG_ENTRIES) {
+                logsDiv.firstElementChild.remove();
+            }
+            logsDiv.scrollTop = logsDiv.scrollHeight;
+        }
+        
+        // Update elapsed time from the server's millisecond timestamps
+        function renderElapsed(s) {
+            if (s.start_ts_ms) {
+                const elapsed = ((s.end_ts_ms || Date.now()) - s.start_ts_ms) / 1000;
                 const m = Math.floor(elapsed / 60);
                 const sec = Math.floor(elapsed % 60);
                 document.getElementById('statTime').textContent = `${m}m ${sec}s`;
             }
+        }
+        
+        // Render a status object
+        function renderStatus(s) {
+            // Update progress bar
+            const progressBar = document.getElementById('progressBar');
+            progressBar.style.width = s.progress + '%';
+            progressBar.textContent = s.progress + '%';
             
-            // Update logs
-            const logsDiv = document.getElementById('logs');
-            logsDiv.innerHTML = s.logs.slice(-50).map(l => `<div class="log-entry">${l}</div>`).join('');
-            logsDiv.scrollTop = logsDiv.scrollHeight;
+            // Update statistics
+            document.getElementById('statCategories').textContent = s.processed_categories + '/' + s.total_categories;
+            document.getElementById('statProperties').textContent = s.total_properties.toLocaleString();
+            document.getElementById('statCurrent').textContent = s.current_category || '-';
             
-            // Update files list
-            if (s.files.length > 0) {
-                document.getElementById('filesList').style.display = 'block';
-                document.getElementById('filesContainer').innerHTML = s.files.map(f =>
-                    `<div class="file-item">
-                        <span>📄 ${f}</span>
-                        <a href="/download?file=${encodeURIComponent(f)}" class="file-download">📥 Download</a>
-                    </div>`
-                ).join('');
-            }
+            renderElapsed(s);
             
             // Update control buttons visibility
             if (s.running) {
@@ -1206,11 +1880,8 @@ HTML_TEMPLATE = '''
                 document.getElementById('pauseBtn').style.display = 'none';
                 document.getElementById('resumeBtn').style.display = 'none';
                 document.getElementById('stopBtn').style.display = 'none';
-            }
-            
-            // Stop polling when extraction is complete
-            if (!s.running && s.end_time) {
-                clearInterval(statusInterval);
+                
+                // Extraction is complete
                 document.getElementById('startBtn').disabled = false;
                 document.getElementById('startBtn').textContent = '🚀 Start Extraction';
             }
@@ -1223,10 +1894,45 @@ HTML_TEMPLATE = '''
 
 # Flask Routes
 
+# Rendered main page as (html, gzipped html) bytes, built on first request
+index_page = None
+
+# Browser cache lifetime for the main page, in seconds
+INDEX_MAX_AGE = 3600
+
+
+def get_index_page():
+    """
+    Render HTML_TEMPLATE once and keep it with a gzip-compressed copy
+    
+    Returns:
+        Tuple of (html bytes, gzip-compressed html bytes)
+    """
+    global index_page
+    if index_page is None:
+        html = render_template_string(
+            HTML_TEMPLATE,
+            sitemap_groups=SITEMAP_GROUPS,
+            all_sitemaps=[url for _, sitemaps in SITEMAP_GROUPS for url, _ in sitemaps]
+        ).encode('utf-8')
+        index_page = (html, gzip.compress(html, compresslevel=9))
+    return index_page
+
+
 @app.route('/')
 def index():
-    """Render main page"""
-    return render_template_string(HTML_TEMPLATE)
+    """Render main page, gzipped when the browser accepts it"""
+    html, html_gz = get_index_page()
+    
+    if 'gzip' in request.accept_encodings:
+        response = Response(html_gz, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(html, mimetype='text/html')
+    
+    response.headers['Cache-Control'] = f'public, max-age={INDEX_MAX_AGE}'
+    response.vary.add('Accept-Encoding')
+    return response
 
 
 @app.route('/get-children')
@@ -1243,6 +1949,38 @@ def get_children_route():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/get-children-bulk', methods=['POST'])
+def get_children_bulk_route():
+    """Get child sitemaps for several parent sitemaps concurrently"""
+    payload = request.get_json(silent=True)
+    parents = payload.get('parents') if isinstance(payload, dict) else None
+    if not parents:
+        return jsonify({'error': 'No URLs provided'}), 400
+    
+    # One upstream lookup is made per entry, so accept only a list of URLs
+    if not isinstance(parents, list) or not all(isinstance(url, str) and url for url in parents):
+        return jsonify({'error': 'parents must be a list of URL strings'}), 400
+    
+    try:
+        # Network-bound: resolve all parents at once over the shared session
+        with ThreadPoolExecutor(max_workers=min(len(parents), 16)) as executor:
+            results = list(executor.map(get_sitemap_children, parents))
+        
+        children = [child for result in results for child in result]
+        return jsonify({'parents': parents, 'children': children})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/clear-cache', methods=['POST'])
+def clear_cache_route():
+    """Forget cached child sitemaps (memory and disk)"""
+    with children_cache_lock:
+        children_cache.clear()
+    clear_cached_children()
+    return jsonify({'status': 'cleared'})
+
+
 @app.route('/start', methods=['POST'])
 def start_extraction():
     """Start extraction process"""
@@ -1252,12 +1990,23 @@ def start_extraction():
         return jsonify({'error': 'Extraction already running'}), 400
     
     config = request.json
-    extraction_status['running'] = True
-    extraction_status['error'] = None
-    extraction_status['logs'] = []
-    extraction_status['files'] = []
-    extraction_status['progress'] = 0
-    extraction_status['total_properties'] = 0
+    stop_event.clear()
+    resume_event.set()
+    with status_changed:
+        extraction_status['logs'].clear()
+        extraction_status['files'].clear()
+    update_status(
+        running=True,
+        error=None,
+        progress=0,
+        total_properties=0,
+        end_time=None,
+        start_ts_ms=None,
+        end_ts_ms=None
+    )
+    
+    # Set once the extractor is constructed, or as soon as setup fails
+    ready = threading.Event()
     
     def run():
         try:
@@ -1265,21 +2014,24 @@ def start_extraction():
                 output_dir=config.get('output_dir'),
                 sitemap_urls=config.get('sitemaps', []),
                 output_format=config.get('output_format', 'csv'),
-                max_workers=int(config.get('workers', 5)),
+                max_workers=max(1, min(int(config.get('workers', 5)), MAX_WORKERS)),
                 webui_mode=True
             )
+            ready.set()
             extractor.run()
         except Exception as e:
-            extraction_status['logs'].append(f'[FATAL ERROR] {str(e)}')
-            extraction_status['error'] = str(e)
-            extraction_status['running'] = False
+            append_log(f'[FATAL ERROR] {str(e)}')
+            update_status(error=str(e), running=False)
+        finally:
+            ready.set()
     
     # Start extraction in background thread
     thread = threading.Thread(target=run)
     thread.daemon = True
     thread.start()
     
-    time.sleep(0.5)
+    # Report setup errors (bad output directory, config values) directly
+    ready.wait(timeout=5)
     
     if extraction_status['error']:
         return jsonify({'error': extraction_status['error']}), 400
@@ -1290,41 +2042,144 @@ def start_extraction():
 @app.route('/pause', methods=['POST'])
 def pause_extraction():
     """Pause extraction"""
-    global extraction_paused
-    extraction_paused = True
-    extraction_status['logs'].append('[PAUSED BY USER]')
+    resume_event.clear()
+    append_log('[PAUSED BY USER]')
     return jsonify({'status': 'paused'})
 
 
 @app.route('/resume', methods=['POST'])
 def resume_extraction():
     """Resume extraction"""
-    global extraction_paused
-    extraction_paused = False
-    extraction_status['logs'].append('[RESUMED BY USER]')
+    resume_event.set()
+    append_log('[RESUMED BY USER]')
     return jsonify({'status': 'resumed'})
 
 
 @app.route('/stop', methods=['POST'])
 def stop_extraction():
-    """Stop extraction"""
-    extraction_status['running'] = False
-    extraction_status['logs'].append('[STOPPED BY USER]')
+    """
+    Stop extraction
+    
+    Workers finish at their next check; running turns False once the
+    extraction thread has actually wound down
+    """
+    stop_event.set()
+    resume_event.set()
+    append_log('[STOPPED BY USER]')
     return jsonify({'status': 'stopped'})
 
 
+# Last /status response body, keyed by (status_version, since, files_since)
+status_cache = (None, b'')
+
+
 @app.route('/status')
 def get_status():
-    """Get current extraction status"""
-    return jsonify(extraction_status)
+    """
+    Get current extraction status
+    
+    With ?since=<log_seq> only log entries newer than that cursor are
+    returned, and with ?files_since=<file_seq> only newly saved files;
+    without them the full lists are sent. The body is re-serialized only
+    after the status has changed
+    """
+    global status_cache
+    since = request.args.get('since', type=int)
+    files_since = request.args.get('files_since', type=int)
+    key = (status_version, since, files_since)
+    
+    cached_key, body = status_cache
+    if cached_key != key:
+        body = orjson.dumps(status_snapshot(since=since, files_since=files_since))
+        status_cache = (key, body)
+    
+    return Response(body, mimetype='application/json')
+
+
+@app.route('/events')
+def status_events():
+    """
+    Stream extraction status as Server-Sent Events
+    
+    The first message carries the full status; later messages carry only
+    the keys that changed, with logs and files limited to new entries.
+    Each message id is the log_seq, so a reconnecting EventSource resumes
+    its log stream via Last-Event-ID. The stream ends once extraction is
+    no longer running
+    """
+    log_seq = request.headers.get('Last-Event-ID', type=int)
+    if log_seq is None:
+        log_seq = request.args.get('since', 0, type=int)
+    
+    def generate():
+        nonlocal log_seq
+        file_seq = None
+        version = None
+        sent = None
+        
+        while True:
+            with status_changed:
+                status_changed.wait_for(lambda: status_version != version, timeout=STATUS_KEEPALIVE)
+                version = status_version
+            
+            snapshot = status_snapshot(since=log_seq, files_since=file_seq)
+            log_seq = snapshot['log_seq']
+            file_seq = snapshot['file_seq']
+            
+            if sent is None:
+                delta = snapshot
+            else:
+                delta = {
+                    key: value for key, value in snapshot.items()
+                    if key not in ('logs', 'files') and sent[key] != value
+                }
+                for key in ('logs', 'files'):
+                    if snapshot[key]:
+                        delta[key] = snapshot[key]
+            
+            if delta:
+                yield f'id: {log_seq}\ndata: '.encode() + orjson.dumps(delta) + b'\n\n'
+                sent = snapshot
+            else:
+                yield b': keep-alive\n\n'
+            
+            if not snapshot['running']:
+                return
+            
+            time.sleep(STATUS_EVENT_INTERVAL)
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/files')
+def list_files():
+    """
+    List saved output files
+    
+    With ?since=<file_seq> only files saved after that cursor are returned
+    """
+    since = request.args.get('since', type=int)
+    with status_changed:
+        files = entries_since(extraction_status['files'], extraction_status['file_seq'], since)
+        file_seq = extraction_status['file_seq']
+    return jsonify({'files': files, 'file_seq': file_seq})
 
 
 @app.route('/download')
 def download_file():
-    """Download generated file"""
+    """
+    Download generated file
+    
+    Served conditionally, so browsers can revalidate and resume
+    interrupted downloads with Range requests
+    """
     filename = request.args.get('file')
     directory = extraction_status.get('output_dir', os.getcwd())
-    return send_from_directory(directory, filename, as_attachment=True)
+    return send_from_directory(directory, filename, as_attachment=True, conditional=True, max_age=0)
 
 
 # Main Entry Point
@@ -1345,6 +2200,11 @@ def main():
         default=5000, 
         help='Web UI port (default: 5000)'
     )
+    parser.add_argument(
+        '--dev-server', 
+        action='store_true', 
+        help="Use Flask's built-in server even when gunicorn is installed"
+    )
     
     args = parser.parse_args()
     
@@ -1363,6 +2223,32 @@ def main():
         print("\n⚠️  Press CTRL+C to stop the server")
         print("\n" + "="*60 + "\n")
         
+        # Prefer gunicorn's threaded worker when installed (not on Windows).
+        # Extraction state lives in this process, so exactly one worker
+        # process is used; its threads serve requests and /events streams.
+        # It runs under this interpreter, whose dependencies were checked
+        gunicorn_installed = importlib.util.find_spec('gunicorn') is not None
+        if gunicorn_installed and not args.dev_server and platform.system() != 'Windows':
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            module = os.path.splitext(os.path.basename(__file__))[0]
+            
+            # execv discards unflushed stdio buffers (block-buffered when
+            # output goes to a pipe or file), which would drop the banner
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, [
+                sys.executable, '-m', 'gunicorn',
+                '--worker-class', 'gthread',
+                '--workers', '1',
+                '--threads', str(WEB_SERVER_THREADS),
+                '--keep-alive', '5',
+                '--bind', f'0.0.0.0:{args.port}',
+                # Import the module from its folder without changing the
+                # working directory, which is the default output directory
+                '--pythonpath', script_dir,
+                f'{module}:app'
+            ])
+        
         # Start Flask server
         app.run(
             host='0.0.0.0', 